@@ -10,23 +10,94 @@ InnerTube API（非公式）を使用して、キーワードなしで大量の
 """
 
 import os
+import re
 import sys
 import csv
-import json
-import time
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional, Set
+from typing import Collection, List, Dict, Optional, Set
 from tqdm import tqdm
 
 try:
     import innertube
+    from innertube.locale import Locale
 except ImportError:
     print("❌ エラー: innertubeライブラリがインストールされていません")
     print("   以下のコマンドでインストールしてください:")
     print("   pip install innertube")
     sys.exit(1)
 
+try:
+    import httpx
+except ImportError:
+    print("❌ エラー: httpxライブラリがインストールされていません")
+    print("   以下のコマンドでインストールしてください:")
+    print("   pip install 'httpx[http2]'")
+    sys.exit(1)
+
+try:
+    import orjson
+except ImportError:
+    print("❌ エラー: orjsonライブラリがインストールされていません")
+    print("   以下のコマンドでインストールしてください:")
+    print("   pip install orjson")
+    sys.exit(1)
+
+try:
+    import numpy as np
+except ImportError:
+    print("❌ エラー: numpyライブラリがインストールされていません")
+    print("   以下のコマンドでインストールしてください:")
+    print("   pip install numpy")
+    sys.exit(1)
+
+try:
+    from aiolimiter import AsyncLimiter
+except ImportError:
+    print("❌ エラー: aiolimiterライブラリがインストールされていません")
+    print("   以下のコマンドでインストールしてください:")
+    print("   pip install aiolimiter")
+    sys.exit(1)
+
+try:
+    from cachetools import LFUCache
+except ImportError:
+    print("❌ エラー: cachetoolsライブラリがインストールされていません")
+    print("   以下のコマンドでインストールしてください:")
+    print("   pip install cachetools")
+    sys.exit(1)
+
+# InnerTube APIのエンドポイントと表示言語・地域
+# （クライアント名・バージョンは innertube ライブラリの設定に合わせる）
+INNERTUBE_API_URL = "https://www.youtube.com/youtubei/v1"
+INNERTUBE_LOCALE = Locale("ja", "JP")
+
+# 同時リクエスト数の上限（レート制限対策、10〜20程度が目安）
+MAX_CONCURRENCY = 16
+
+# 1秒あたりのリクエスト数の上限（トークンバケット）
+MAX_REQUESTS_PER_SECOND = 10
+
+# チャンネル情報キャッシュの最大件数（超えたら参照頻度の低いものから破棄）
+CHANNEL_CACHE_SIZE = 100_000
+
+# 再生回数・長さとして受け付ける上限（filter_videos の int64 配列に収まる範囲）
+_INT64_MAX = np.iinfo(np.int64).max
+
+# player/browseのURL
+_PLAYER_URL = f"{INNERTUBE_API_URL}/player?prettyPrint=false"
+_BROWSE_URL = f"{INNERTUBE_API_URL}/browse?prettyPrint=false"
+
+# キーワード検索を並行実行するスレッド数
+MAX_SEARCH_WORKERS = 5
+
+# 登録者数テキスト（例: "1.5万人の登録者"）の数値部分と単位
+_SUB_RE = re.compile(r'([\d.,]+)\s*([万千KkMm])?')
+_MULT = {'万': 10000, '千': 1000, 'K': 1000, 'k': 1000, 'M': 1000000, 'm': 1000000}
+
 # ロギング設定
 logging.basicConfig(
     level=logging.INFO,
@@ -34,6 +105,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# プロセス内で共有するInnerTubeクライアント（初回利用時に作成）
+_CLIENT: Optional[innertube.InnerTube] = None
+
+
+def _get_innertube_client() -> innertube.InnerTube:
+    """
+    共有InnerTubeクライアントを取得
+
+    クライアントごとにHTTPセッション（接続プール）が作られるため、
+    InnerTubeSearcherを複数作成しても一度だけ作成して使い回します。
+
+    Returns:
+        InnerTubeクライアント
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = innertube.InnerTube("WEB", locale=INNERTUBE_LOCALE)
+    return _CLIENT
+
+
+@dataclass(slots=True)
+class VideoRec:
+    """動画情報（get_video_details の結果1件分）"""
+
+    video_id: str
+    title: str
+    channel_id: str
+    channel_name: str
+    view_count: int
+    length_seconds: int
+    publish_ts: Optional[int]  # 投稿日時（UTCのPOSIXタイムスタンプ）
+    subscriber_count: int = 0
+
 
 class InnerTubeSearcher:
     """InnerTube APIを使用した動画検索クラス"""
@@ -45,23 +149,66 @@ class InnerTubeSearcher:
         print("="*60 + "\n")
 
         try:
-            self.client = innertube.InnerTube("WEB")
+            self.client = _get_innertube_client()
             print("✅ InnerTube クライアント初期化完了")
         except Exception as e:
             print(f"❌ InnerTube クライアントの初期化に失敗: {e}")
             raise
 
         self.video_ids: Set[str] = set()  # 重複排除用
-        self.channel_cache: Dict[str, Optional[int]] = {}  # チャンネル情報キャッシュ
+        self.channel_cache: LFUCache = LFUCache(maxsize=CHANNEL_CACHE_SIZE)  # チャンネル情報キャッシュ
+
+        # YT_DEBUG=1 のときだけAPIレスポンスをdebug/に保存する
+        self._debug = os.getenv("YT_DEBUG") == "1"
+
+        # 並行リクエスト用のイベントループとHTTPクライアント（keep-aliveで接続を再利用）
+        self._loop = asyncio.new_event_loop()
+        self._http: Optional[httpx.AsyncClient] = None
+
+        # player/browse共通のレート制限（上限までは待たずに送信する）
+        self._limiter = AsyncLimiter(MAX_REQUESTS_PER_SECOND, 1)
 
-    def fetch_trending_videos(self) -> List[str]:
+        # player/browseのリクエストボディのテンプレートとヘッダー
+        # 検索に使うinnertubeクライアントと同じコンテキスト（クライアントのバージョン・
+        # User-Agentなど）を使う。ボディは一度だけJSON化し、リクエストごとには
+        # プレースホルダーをIDに置き換えるだけにする
+        client_context = self.client.adaptor.context
+        context = {"client": client_context.context()}
+        self._player_body_tmpl = orjson.dumps({"context": context, "videoId": "__ID__"})
+        self._browse_body_tmpl = orjson.dumps({"context": context, "browseId": "__ID__"})
+        self._headers = {**client_context.headers(), "Content-Type": "application/json"}
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        共有HTTPクライアントを取得（初回呼び出し時に作成）
+
+        Returns:
+            全てのInnerTubeリクエストで共有するHTTPクライアント
+        """
+        if self._http is None:
+            limits = httpx.Limits(
+                max_connections=MAX_CONCURRENCY * 2,
+                max_keepalive_connections=MAX_CONCURRENCY * 2
+            )
+            self._http = httpx.AsyncClient(http2=True, limits=limits, timeout=30.0)
+        return self._http
+
+    def close(self):
+        """HTTPクライアントとイベントループを解放"""
+        if self._http is not None:
+            self._loop.run_until_complete(self._http.aclose())
+            self._http = None
+        if not self._loop.is_closed():
+            self._loop.close()
+
+    def fetch_trending_videos(self) -> int:
         """
         検索エンドポイントを使って人気動画のIDを取得
 
-        複数のキーワードで検索して動画を収集します。
+        複数のキーワードで検索して動画を収集し、self.video_ids に追加します。
 
         Returns:
-            動画IDのリスト
+            新たに追加された動画IDの件数
         """
         print("📊 人気動画を検索中...")
 
@@ -74,49 +221,16 @@ class InnerTubeSearcher:
             "トレンド"
         ]
 
-        all_video_ids = []
-
-        try:
-            for keyword in keywords:
-                try:
-                    # searchエンドポイントを使用
-                    data = self.client.search(query=keyword)
-
-                    # デバッグ用: レスポンスを保存
-                    self._save_debug_response(data, f'search_{keyword}_response.json')
-
-                    # 動画IDを抽出
-                    video_ids = self.parse_video_ids(data)
-                    all_video_ids.extend(video_ids)
-
-                    print(f"  ✅ '{keyword}' で {len(video_ids)} 件取得")
-
-                    # レート制限対策
-                    time.sleep(0.5)
-
-                except Exception as e:
-                    print(f"  ⚠️  '{keyword}' の検索に失敗: {e}")
-                    logger.warning(f"検索エラー ({keyword}): {e}")
-                    continue
-
-            # 重複削除
-            unique_video_ids = list(set(all_video_ids))
-            print(f"✅ 合計 {len(unique_video_ids)} 件の動画を取得しました（重複除去後）")
-            return unique_video_ids
-
-        except Exception as e:
-            print(f"⚠️  動画検索に失敗: {e}")
-            logger.error(f"検索エラー: {e}", exc_info=True)
-            return []
+        return self._search_keywords(keywords, 'search_{}_response.json')
 
-    def fetch_home_feed_videos(self) -> List[str]:
+    def fetch_home_feed_videos(self) -> int:
         """
         検索エンドポイントを使って様々なジャンルの動画を取得
 
-        複数のジャンルキーワードで検索して動画を収集します。
+        複数のジャンルキーワードで検索して動画を収集し、self.video_ids に追加します。
 
         Returns:
-            動画IDのリスト
+            新たに追加された動画IDの件数
         """
         print("🏠 様々なジャンルの動画を検索中...")
 
@@ -129,169 +243,235 @@ class InnerTubeSearcher:
             "旅行"
         ]
 
-        all_video_ids = []
+        return self._search_keywords(keywords, 'search_genre_{}_response.json')
 
-        try:
-            for keyword in keywords:
-                try:
-                    # searchエンドポイントを使用
-                    data = self.client.search(query=keyword)
+    def _search_keywords(self, keywords: List[str], debug_filename: str) -> int:
+        """
+        複数のキーワードでの検索をスレッドプールで並行実行し、動画IDを self.video_ids に収集
 
-                    # デバッグ用: レスポンスを保存
-                    self._save_debug_response(data, f'search_genre_{keyword}_response.json')
+        Args:
+            keywords: 検索キーワードのリスト
+            debug_filename: デバッグ用レスポンスのファイル名（{}にキーワードが入る）
 
-                    # 動画IDを抽出
-                    video_ids = self.parse_video_ids(data)
-                    all_video_ids.extend(video_ids)
+        Returns:
+            新たに追加された動画IDの件数
+        """
+        total_before = len(self.video_ids)
 
-                    print(f"  ✅ '{keyword}' で {len(video_ids)} 件取得")
+        try:
+            with ThreadPoolExecutor(max_workers=MAX_SEARCH_WORKERS) as executor:
+                futures = {
+                    executor.submit(self.client.search, query=keyword): keyword
+                    for keyword in keywords
+                }
+
+                for future in as_completed(futures):
+                    keyword = futures[future]
+                    try:
+                        data = future.result()
 
-                    # レート制限対策
-                    time.sleep(0.5)
+                        # デバッグ用: レスポンスを保存
+                        self._save_debug_response(data, debug_filename.format(keyword))
 
-                except Exception as e:
-                    print(f"  ⚠️  '{keyword}' の検索に失敗: {e}")
-                    logger.warning(f"検索エラー ({keyword}): {e}")
-                    continue
+                        # 動画IDを抽出（self.video_ids に直接追加）
+                        before = len(self.video_ids)
+                        self._find_into(data, self.video_ids)
 
-            # 重複削除
-            unique_video_ids = list(set(all_video_ids))
-            print(f"✅ 合計 {len(unique_video_ids)} 件の動画を取得しました（重複除去後）")
-            return unique_video_ids
+                        print(f"  ✅ '{keyword}' で {len(self.video_ids) - before} 件取得（新規）")
+
+                    except Exception as e:
+                        print(f"  ⚠️  '{keyword}' の検索に失敗: {e}")
+                        logger.warning(f"検索エラー ({keyword}): {e}")
+                        continue
+
+            added = len(self.video_ids) - total_before
+            print(f"✅ 合計 {added} 件の動画を取得しました（重複除去後）")
+            return added
 
         except Exception as e:
             print(f"⚠️  動画検索に失敗: {e}")
             logger.error(f"検索エラー: {e}", exc_info=True)
-            return []
+            return len(self.video_ids) - total_before
 
     def parse_video_ids(self, response: dict) -> List[str]:
         """
-        レスポンスから動画IDを再帰的に抽出
+        レスポンスから動画IDを抽出
 
         Args:
             response: InnerTube APIのレスポンス
 
         Returns:
-            動画IDのリスト
+            動画IDのリスト（重複なし）
         """
-        video_ids = []
+        video_ids: Set[str] = set()
 
         try:
-            video_ids = self._recursive_find_video_ids(response)
-            video_ids = list(set(video_ids))  # 重複削除
+            self._find_into(response, video_ids)
         except Exception as e:
             print(f"⚠️  動画IDのパースに失敗: {e}")
             logger.error(f"パースエラー: {e}", exc_info=True)
 
-        return video_ids
+        return list(video_ids)
 
-    def _recursive_find_video_ids(self, obj, video_ids=None) -> List[str]:
+    def _find_into(self, obj, out: Set[str]):
         """
-        再帰的に動画IDを探索
+        スタックを使ってレスポンス全体を走査し、見つけた動画IDを out に追加
+
+        再帰呼び出しを使わないため、深くネストした大きなレスポンスでも高速に動作します。
 
         Args:
             obj: 探索対象のオブジェクト（dict, list, その他）
-            video_ids: 動画IDを蓄積するリスト
-
-        Returns:
-            動画IDのリスト
+            out: 動画IDを追加する集合
         """
-        if video_ids is None:
-            video_ids = []
-
-        if isinstance(obj, dict):
-            # videoIdキーが見つかったら追加
-            if 'videoId' in obj:
-                video_id = obj['videoId']
-                if isinstance(video_id, str) and len(video_id) == 11:  # YouTube動画IDは11文字
-                    video_ids.append(video_id)
-
-            # 全てのキーを再帰的に探索
-            for key, value in obj.items():
-                self._recursive_find_video_ids(value, video_ids)
-
-        elif isinstance(obj, list):
-            # リストの各要素を再帰的に探索
-            for item in obj:
-                self._recursive_find_video_ids(item, video_ids)
-
-        return video_ids
-
-    def get_video_details(self, video_ids: List[str]) -> List[Dict]:
+        add = out.add
+        stack = [obj]
+        pop = stack.pop
+        extend = stack.extend
+
+        while stack:
+            node = pop()
+            node_type = type(node)
+            if node_type is dict:
+                # videoIdキーが見つかったら追加（YouTube動画IDは11文字）
+                video_id = node.get('videoId')
+                if type(video_id) is str and len(video_id) == 11:
+                    add(video_id)
+                extend(node.values())
+            elif node_type is list:
+                extend(node)
+
+    def get_video_details(self, video_ids: Collection[str]) -> List[VideoRec]:
         """
         動画の詳細情報を取得
 
-        InnerTube APIのplayerエンドポイントを使用して、
+        InnerTube APIのplayerエンドポイントに並行してリクエストし、
         動画タイトル、チャンネル名、再生回数、投稿日などを取得します。
+        同時リクエスト数はMAX_CONCURRENCYで制限されます。
 
         Args:
-            video_ids: 動画IDのリスト
+            video_ids: 動画IDのコレクション（重複なし）
 
         Returns:
-            動画情報の辞書のリスト
+            動画情報のリスト
         """
         print(f"\n📝 動画詳細を取得中: {len(video_ids)} 件")
 
-        videos = []
+        videos = self._loop.run_until_complete(self._fetch_video_details(video_ids))
+
+        print(f"✅ 動画詳細取得完了: {len(videos)} 件")
+        return videos
 
-        for video_id in tqdm(video_ids, desc="動画詳細取得"):
+    async def _fetch_video_details(self, video_ids: Collection[str]) -> List[VideoRec]:
+        """
+        playerエンドポイントへのリクエストを並行実行
+
+        Args:
+            video_ids: 動画IDのコレクション（重複なし）
+
+        Returns:
+            動画情報のリスト（取得に失敗した動画は含まない）
+        """
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        client = self._get_http()
+
+        async def fetch(video_id: str) -> Optional[VideoRec]:
             try:
-                # レート制限対策
-                time.sleep(0.3)
+                async with sem, self._limiter:
+                    player_data = await self._post_player(client, video_id)
+                return self._parse_player_response(video_id, player_data)
+            except Exception as e:
+                logger.warning(f"動画 {video_id} の詳細取得に失敗: {e}")
+                return None
 
-                # playerエンドポイントで詳細取得
-                player_data = self.client.player(video_id=video_id)
+        # 完了した順に結果を受け取り、レスポンスの解析と通信待ちを重ねる
+        videos = []
+        tasks = [fetch(v) for v in video_ids]
+        with tqdm(total=len(tasks), desc="動画詳細取得") as pbar:
+            for coro in asyncio.as_completed(tasks):
+                video = await coro
+                if video:
+                    videos.append(video)
+                pbar.update(1)
 
-                # videoDetailsから情報を抽出
-                video_details = player_data.get('videoDetails', {})
+        return videos
+
+    async def _post_player(self, client: httpx.AsyncClient, video_id: str) -> dict:
+        """
+        playerエンドポイントにPOSTリクエストを送信
 
-                if not video_details:
-                    logger.warning(f"動画 {video_id} の詳細が取得できませんでした")
-                    continue
+        Args:
+            client: HTTPクライアント
+            video_id: 動画ID
 
-                # 基本情報を抽出
-                title = video_details.get('title', '')
-                channel_id = video_details.get('channelId', '')
-                channel_name = video_details.get('author', '')
-                view_count = int(video_details.get('viewCount', 0))
-                length_seconds = int(video_details.get('lengthSeconds', 0))
+        Returns:
+            playerエンドポイントのレスポンス
+        """
+        body = self._player_body_tmpl.replace(b"__ID__", video_id.encode())
+        response = await client.post(_PLAYER_URL, content=body, headers=self._headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
-                # 投稿日はmicroformatから取得
-                microformat = player_data.get('microformat', {}).get('playerMicroformatRenderer', {})
-                publish_date_str = microformat.get('publishDate', '')
+    def _parse_player_response(self, video_id: str, player_data: dict) -> Optional[VideoRec]:
+        """
+        playerエンドポイントのレスポンスから動画情報を抽出
 
-                # 投稿日をdatetimeに変換
-                if publish_date_str:
-                    try:
-                        publish_date = datetime.fromisoformat(publish_date_str.replace('Z', '+00:00'))
-                    except ValueError:
-                        publish_date = None
-                else:
-                    publish_date = None
-
-                videos.append({
-                    'video_id': video_id,
-                    'title': title,
-                    'channel_id': channel_id,
-                    'channel_name': channel_name,
-                    'view_count': view_count,
-                    'length_seconds': length_seconds,
-                    'publish_date': publish_date
-                })
+        Args:
+            video_id: 動画ID
+            player_data: playerエンドポイントのレスポンス
 
-            except Exception as e:
-                logger.warning(f"動画 {video_id} の詳細取得に失敗: {e}")
-                continue
+        Returns:
+            動画情報（詳細が含まれていない場合はNone）
+        """
+        # videoDetailsから情報を抽出
+        video_details = player_data.get('videoDetails', {})
 
-        print(f"✅ 動画詳細取得完了: {len(videos)} 件")
-        return videos
+        if not video_details:
+            logger.warning(f"動画 {video_id} の詳細が取得できませんでした")
+            return None
 
-    def get_channel_subscribers(self, channel_ids: List[str]) -> Dict[str, Optional[int]]:
+        # 基本情報を抽出
+        title = video_details.get('title', '')
+        channel_id = video_details.get('channelId', '')
+        channel_name = video_details.get('author', '')
+        view_count = int(video_details.get('viewCount', 0))
+        length_seconds = int(video_details.get('lengthSeconds', 0))
+        # filter_videos はint64で集計するため、範囲外の値は不正なレスポンスとして扱う
+        if view_count > _INT64_MAX or length_seconds > _INT64_MAX:
+            raise ValueError(f"再生回数または長さが範囲外です: {view_count}, {length_seconds}")
+
+        # 投稿日はmicroformatから取得
+        microformat = player_data.get('microformat', {}).get('playerMicroformatRenderer', {})
+        publish_date_str = microformat.get('publishDate', '')
+
+        # 投稿日をUTCのPOSIXタイムスタンプに変換
+        publish_ts = None
+        if publish_date_str:
+            try:
+                publish_date = datetime.fromisoformat(publish_date_str.replace('Z', '+00:00'))
+                if publish_date.tzinfo is None:
+                    publish_date = publish_date.replace(tzinfo=timezone.utc)
+                publish_ts = int(publish_date.timestamp())
+            except ValueError:
+                publish_ts = None
+
+        return VideoRec(
+            video_id=video_id,
+            title=title,
+            channel_id=channel_id,
+            channel_name=channel_name,
+            view_count=view_count,
+            length_seconds=length_seconds,
+            publish_ts=publish_ts
+        )
+
+    def get_channel_subscribers(self, channel_ids: Collection[str]) -> Dict[str, Optional[int]]:
         """
         チャンネルの登録者数を取得（キャッシュあり）
 
+        キャッシュにないチャンネルだけをbrowseエンドポイントに並行して問い合わせます。
+
         Args:
-            channel_ids: チャンネルIDのリスト
+            channel_ids: チャンネルIDの集合（重複なし）
 
         Returns:
             channel_id -> 登録者数 の辞書（取得できない場合はNone）
@@ -302,52 +482,91 @@ class InnerTubeSearcher:
         if uncached_ids:
             print(f"\n👥 チャンネル登録者数を取得中: {len(uncached_ids)} 件（キャッシュ: {len(channel_ids) - len(uncached_ids)} 件）")
 
-            for channel_id in tqdm(uncached_ids, desc="チャンネル情報取得"):
-                try:
-                    # レート制限対策
-                    time.sleep(0.3)
-
-                    # browseエンドポイントでチャンネル情報を取得
-                    channel_data = self.client.browse(browse_id=channel_id)
-
-                    # ヘッダーから登録者数を抽出
-                    header = channel_data.get('header', {})
-
-                    # c4TabbedHeaderRendererまたはpageHeaderRendererから登録者数を取得
-                    subscriber_count = None
-
-                    if 'c4TabbedHeaderRenderer' in header:
-                        subscriber_text = header['c4TabbedHeaderRenderer'].get('subscriberCountText', {})
-                        if 'simpleText' in subscriber_text:
-                            subscriber_count = self._parse_subscriber_count(subscriber_text['simpleText'])
-
-                    elif 'pageHeaderRenderer' in header:
-                        content = header['pageHeaderRenderer'].get('content', {})
-                        if 'pageHeaderViewModel' in content:
-                            metadata = content['pageHeaderViewModel'].get('metadata', {})
-                            if 'contentMetadataViewModel' in metadata:
-                                metadata_rows = metadata['contentMetadataViewModel'].get('metadataRows', [])
-                                for row in metadata_rows:
-                                    if 'metadataParts' in row:
-                                        for part in row['metadataParts']:
-                                            if 'text' in part and 'text' in part['text']:
-                                                text = part['text']['text']
-                                                if '登録者' in text or 'subscriber' in text.lower():
-                                                    subscriber_count = self._parse_subscriber_count(text)
-                                                    break
-
-                    self.channel_cache[channel_id] = subscriber_count
-
-                except Exception as e:
-                    logger.warning(f"チャンネル {channel_id} の登録者数取得に失敗: {e}")
-                    self.channel_cache[channel_id] = None
-                    continue
+            self._loop.run_until_complete(self._fetch_channel_subscribers(uncached_ids))
 
             print(f"✅ チャンネル登録者数取得完了")
 
         # キャッシュから返す
         return {cid: self.channel_cache.get(cid) for cid in channel_ids}
 
+    async def _fetch_channel_subscribers(self, channel_ids: List[str]):
+        """
+        browseエンドポイントへのリクエストを並行実行し、結果をキャッシュに格納
+
+        Args:
+            channel_ids: チャンネルIDのリスト（キャッシュ未登録のもの）
+        """
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        client = self._get_http()
+
+        async def _fetch_one(channel_id: str):
+            try:
+                async with sem, self._limiter:
+                    channel_data = await self._post_browse(client, channel_id)
+                return channel_id, self._parse_channel_subscribers(channel_data)
+            except Exception as e:
+                logger.warning(f"チャンネル {channel_id} の登録者数取得に失敗: {e}")
+                return channel_id, None
+
+        # 完了した順にキャッシュへ格納
+        tasks = [_fetch_one(c) for c in channel_ids]
+        with tqdm(total=len(tasks), desc="チャンネル情報取得") as pbar:
+            for coro in asyncio.as_completed(tasks):
+                channel_id, subscriber_count = await coro
+                self.channel_cache[channel_id] = subscriber_count
+                pbar.update(1)
+
+    async def _post_browse(self, client: httpx.AsyncClient, browse_id: str) -> dict:
+        """
+        browseエンドポイントにPOSTリクエストを送信
+
+        Args:
+            client: HTTPクライアント
+            browse_id: ブラウズID（チャンネルIDなど）
+
+        Returns:
+            browseエンドポイントのレスポンス
+        """
+        body = self._browse_body_tmpl.replace(b"__ID__", browse_id.encode())
+        response = await client.post(_BROWSE_URL, content=body, headers=self._headers)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _parse_channel_subscribers(self, channel_data: dict) -> Optional[int]:
+        """
+        browseエンドポイントのレスポンスから登録者数を抽出
+
+        Args:
+            channel_data: browseエンドポイントのレスポンス
+
+        Returns:
+            登録者数（取得できない場合はNone）
+        """
+        # ヘッダーから登録者数を抽出
+        header = channel_data.get('header', {})
+
+        # c4TabbedHeaderRendererまたはpageHeaderRendererから登録者数を取得
+        if 'c4TabbedHeaderRenderer' in header:
+            subscriber_text = header['c4TabbedHeaderRenderer'].get('subscriberCountText', {})
+            if 'simpleText' in subscriber_text:
+                return self._parse_subscriber_count(subscriber_text['simpleText'])
+
+        elif 'pageHeaderRenderer' in header:
+            content = header['pageHeaderRenderer'].get('content', {})
+            if 'pageHeaderViewModel' in content:
+                metadata = content['pageHeaderViewModel'].get('metadata', {})
+                if 'contentMetadataViewModel' in metadata:
+                    metadata_rows = metadata['contentMetadataViewModel'].get('metadataRows', [])
+                    for row in metadata_rows:
+                        if 'metadataParts' in row:
+                            for part in row['metadataParts']:
+                                if 'text' in part and 'text' in part['text']:
+                                    text = part['text']['text']
+                                    if '登録者' in text or 'subscriber' in text.lower():
+                                        return self._parse_subscriber_count(text)
+
+        return None
+
     def _parse_subscriber_count(self, text: str) -> Optional[int]:
         """
         登録者数のテキストを数値に変換
@@ -361,33 +580,22 @@ class InnerTubeSearcher:
         Returns:
             登録者数（取得できない場合はNone）
         """
-        import re
-
         # 数値部分を抽出
-        match = re.search(r'([\d.,]+)\s*([万千KkMm])?', text)
+        match = _SUB_RE.search(text)
         if not match:
             return None
 
-        number_str = match.group(1).replace(',', '').replace('.', '')
-        multiplier_str = match.group(2)
-
         try:
             number = float(match.group(1).replace(',', ''))
         except ValueError:
             return None
 
         # 単位に応じて乗算
-        if multiplier_str:
-            if multiplier_str in ['万', 'K', 'k']:
-                number *= 10000 if multiplier_str == '万' else 1000
-            elif multiplier_str in ['千']:
-                number *= 1000
-            elif multiplier_str in ['M', 'm']:
-                number *= 1000000
+        number *= _MULT.get(match.group(2), 1)
 
         return int(number)
 
-    def filter_videos(self, videos: List[Dict]) -> List[Dict]:
+    def filter_videos(self, videos: List[VideoRec]) -> List[VideoRec]:
         """
         条件に合う動画をフィルタリング
 
@@ -404,56 +612,49 @@ class InnerTubeSearcher:
         """
         print("\n🔎 条件に合う動画をフィルタリング中...")
 
-        # 半年前の日付
-        six_months_ago = datetime.now(timezone.utc) - timedelta(days=180)
+        # 半年前の日時（POSIXタイムスタンプ）
+        cutoff_ts = int((datetime.now(timezone.utc) - timedelta(days=180)).timestamp())
+
+        # 先に投稿日で絞り込み、半年以内の動画のチャンネルだけを問い合わせる
+        total = len(videos)
+        videos = [v for v in videos if v.publish_ts is not None and v.publish_ts >= cutoff_ts]
 
         # チャンネルIDを抽出
-        channel_ids = list(set([v['channel_id'] for v in videos if v.get('channel_id')]))
+        channel_ids = {v.channel_id for v in videos if v.channel_id}
 
         # 登録者数を取得
         channel_subscribers = self.get_channel_subscribers(channel_ids)
 
-        # フィルタリング
-        filtered = []
+        # 判定に使う値を1回の走査でNumPy配列にまとめる（取得できない登録者数は-1）
+        cs_get = channel_subscribers.get
+        n = len(videos)
+        cols = np.fromiter(
+            (
+                (-1 if (sc := cs_get(v.channel_id)) is None else sc, v.view_count)
+                for v in videos
+            ),
+            dtype=[('subs', np.int64), ('views', np.int64)],
+            count=n
+        )
+        subs, views = cols['subs'], cols['views']
+
+        # 登録者数が取得でき、10,000人未満
+        mask_small = (subs >= 0) & (subs < 10000)
+        # 再生回数が登録者数の3倍以上
+        mask = mask_small & (views >= subs * 3)
+
         stats = {
-            'total': len(videos),
-            'recent': 0,
-            'small_channel': 0,
-            'buzz': 0
+            'total': total,
+            'recent': n,
+            'small_channel': int(mask_small.sum()),
+            'buzz': int(mask.sum())
         }
 
-        for video in videos:
-            channel_id = video.get('channel_id')
-            publish_date = video.get('publish_date')
-            view_count = video.get('view_count', 0)
-
-            # 登録者数を取得
-            subscriber_count = channel_subscribers.get(channel_id)
-
-            # 登録者数が取得できない場合はスキップ
-            if subscriber_count is None:
-                continue
-
-            # 投稿日が取得できない、または半年以内でない場合はスキップ
-            if not publish_date or publish_date < six_months_ago:
-                continue
-
-            stats['recent'] += 1
-
-            # 登録者数が10,000人以上の場合はスキップ
-            if subscriber_count >= 10000:
-                continue
-
-            stats['small_channel'] += 1
-
-            # 再生回数が登録者数の3倍未満の場合はスキップ
-            if view_count < subscriber_count * 3:
-                continue
-
-            stats['buzz'] += 1
-
-            # 条件に合致した動画を追加
-            video['subscriber_count'] = subscriber_count
+        # 条件に合致した動画を追加
+        filtered = []
+        for i in np.nonzero(mask)[0]:
+            video = videos[i]
+            video.subscriber_count = int(subs[i])
             filtered.append(video)
 
         print(f"\n📊 フィルタリング結果:")
@@ -464,7 +665,7 @@ class InnerTubeSearcher:
 
         return filtered
 
-    def export_to_csv(self, videos: List[Dict], filename: str):
+    def export_to_csv(self, videos: List[VideoRec], filename: str):
         """
         動画リストをCSVファイルに出力
 
@@ -474,23 +675,27 @@ class InnerTubeSearcher:
         """
         print(f"\n💾 CSV出力中: {filename}")
 
+        # 行データを先に組み立てて writerows で一括書き込み
+        rows = [
+            (
+                video.title,
+                f"https://www.youtube.com/watch?v={video.video_id}",
+                video.channel_name,
+                video.view_count,
+                video.subscriber_count
+            )
+            for video in videos
+        ]
+
         # UTF-8 BOM付きで出力（Excel対応）
-        with open(filename, 'w', encoding='utf-8-sig', newline='') as f:
+        with open(filename, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
             writer = csv.writer(f)
 
             # ヘッダー
             writer.writerow(['動画タイトル', 'url', 'チャンネル名', '再生回数', '登録者数'])
 
             # データ
-            for video in videos:
-                url = f"https://www.youtube.com/watch?v={video['video_id']}"
-                writer.writerow([
-                    video['title'],
-                    url,
-                    video['channel_name'],
-                    video['view_count'],
-                    video['subscriber_count']
-                ])
+            writer.writerows(rows)
 
         print(f"✅ CSV出力完了: {filename}")
 
@@ -498,17 +703,22 @@ class InnerTubeSearcher:
         """
         デバッグ用: APIレスポンスをJSONファイルに保存
 
+        環境変数 YT_DEBUG=1 が設定されている場合のみ保存します。
+
         Args:
             data: APIレスポンス
             filename: 出力ファイル名
         """
+        if not self._debug:
+            return
+
         try:
             debug_dir = os.path.join(os.path.dirname(__file__), 'debug')
             os.makedirs(debug_dir, exist_ok=True)
 
             filepath = os.path.join(debug_dir, filename)
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
 
             logger.debug(f"デバッグレスポンスを保存: {filepath}")
         except Exception as e:
@@ -533,6 +743,8 @@ def main():
     print("="*60)
     print()
 
+    searcher = None
+
     try:
         # InnerTubeSearcherインスタンスを作成
         searcher = InnerTubeSearcher()
@@ -543,13 +755,13 @@ def main():
         print("="*60)
 
         # 人気キーワードで動画を検索
-        popular_ids = searcher.fetch_trending_videos()
+        searcher.fetch_trending_videos()
 
         # ジャンル別で動画を検索
-        genre_ids = searcher.fetch_home_feed_videos()
+        searcher.fetch_home_feed_videos()
 
-        # 重複削除
-        all_video_ids = list(set(popular_ids + genre_ids))
+        # 収集した動画ID（searcher.video_ids で重複排除済み）
+        all_video_ids = searcher.video_ids
         print(f"\n✅ 合計 {len(all_video_ids)} 件の動画IDを収集（重複除去後）")
 
         if not all_video_ids:
@@ -604,6 +816,9 @@ def main():
         print(f"\n❌ エラーが発生しました: {e}")
         logger.error("予期しないエラー", exc_info=True)
         sys.exit(1)
+    finally:
+        if searcher is not None:
+            searcher.close()
 
 
 if __name__ == '__main__':
@@ -11,9 +11,18 @@ import sys
 import csv
 import argparse
 import time
+import shelve
+import contextlib
+import dbm
+import asyncio
+import logging
 import isodate
+import httpx
+import orjson
 from datetime import datetime, timedelta, timezone
-from typing import List, Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+from aiolimiter import AsyncLimiter
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -23,6 +32,62 @@ from googleapiclient.errors import HttpError
 # OAuth2のスコープ（読み取り専用）
 SCOPES = ['https://www.googleapis.com/auth/youtube.readonly']
 
+# ディスクキャッシュ（実行をまたいで統計情報・登録者数を再利用）
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.yt_cache')
+SUBSCRIBER_TTL_SECONDS = 24 * 60 * 60  # 登録者数: 24時間
+VIDEO_STATS_TTL_SECONDS = 60 * 60      # 動画統計情報: 1時間
+
+# videos.list / channels.list を直接呼び出すためのエンドポイント
+YOUTUBE_API_URL = 'https://www.googleapis.com/youtube/v3'
+# リソースごとのURL（末尾にカンマ区切りのIDを付けるだけで完成する形で用意しておく）
+API_URL_PREFIXES = {
+    'videos': f'{YOUTUBE_API_URL}/videos?part=statistics,contentDetails&id=',
+    'channels': f'{YOUTUBE_API_URL}/channels?part=statistics&id=',
+}
+BATCH_SIZE = 50       # 1リクエストあたりの最大ID数
+MAX_CONCURRENCY = 8   # 同時リクエスト数の上限
+MAX_CONNECTIONS = 20  # 接続プールの最大接続数（keep-aliveで再利用）
+MAX_REQUESTS_PER_SECOND = 10  # 1秒あたりのリクエスト数の上限（トークンバケット）
+
+# クオータ（1日あたりの上限と各APIのコスト）
+DAILY_QUOTA_BUDGET = 10000
+QUOTA_COSTS = {'search': 100, 'videos': 1, 'channels': 1}
+# クオータは太平洋時間の午前0時にリセットされる
+QUOTA_TIMEZONE_NAME = 'America/Los_Angeles'
+
+logger = logging.getLogger(__name__)
+
+# CSVの列（動画dictのキー → ヘッダー）
+CSV_COLUMNS = {
+    'title': '動画タイトル',
+    'url': 'url',
+    'channel_title': 'チャンネル名',
+    'view_count': '再生回数',
+    'duration_seconds': '動画の長さ（秒）',
+    'subscriber_count': '登録者数',
+}
+
+
+class CacheLockedError(RuntimeError):
+    """キャッシュファイルを開けなかった（別のプロセスが使用中の可能性がある）"""
+
+
+class _SafeFilenameTable(dict):
+    """
+    ファイル名に使えない文字を '_' に置き換える str.translate 用の変換テーブル
+
+    出現した文字だけを初回参照時に判定して登録します。
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        replacement = char if char.isalnum() or char in ' _-' else '_'
+        self[codepoint] = replacement
+        return replacement
+
+
+_SAFE_TABLE = _SafeFilenameTable()
+
 
 def parse_duration(duration: str) -> int:
     """
@@ -46,13 +111,13 @@ def parse_duration(duration: str) -> int:
         duration_obj = isodate.parse_duration(duration)
         return int(duration_obj.total_seconds())
     except Exception as e:
-        print(f"⚠️  duration のパースに失敗しました: {duration}, エラー: {e}")
+        logger.warning(f"⚠️  duration のパースに失敗しました: {duration}, エラー: {e}")
         return 0
 
 
-def get_authenticated_service():
+def get_credentials() -> Credentials:
     """
-    OAuth2認証を行い、認証済みのYouTube APIサービスを返す
+    OAuth2認証を行い、認証情報を返す
 
     自動で以下を実行:
     - 初回実行: ブラウザで認証 → token.json生成
@@ -60,7 +125,7 @@ def get_authenticated_service():
     - トークン期限切れ: 自動更新
 
     Returns:
-        googleapiclient.discovery.Resource: YouTube APIサービス
+        google.oauth2.credentials.Credentials: 認証情報
 
     Raises:
         FileNotFoundError: credentials.jsonが見つからない場合
@@ -137,6 +202,19 @@ def get_authenticated_service():
     else:
         print("✅ 既存の認証情報を使用します")
 
+    return creds
+
+
+def get_authenticated_service(creds: Credentials):
+    """
+    認証済みのYouTube APIサービスを返す
+
+    Args:
+        creds: get_credentials() で取得した認証情報
+
+    Returns:
+        googleapiclient.discovery.Resource: YouTube APIサービス
+    """
     # YouTube APIクライアントを構築
     return build('youtube', 'v3', credentials=creds)
 
@@ -144,88 +222,518 @@ def get_authenticated_service():
 class YouTubeSearcher:
     """YouTube動画検索・フィルタリングクラス"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        cache_ttl: int = SUBSCRIBER_TTL_SECONDS,
+        daily_quota_budget: int = DAILY_QUOTA_BUDGET
+    ):
         """
         初期化
 
         OAuth2認証を行い、YouTube APIクライアントを初期化します。
         初回実行時はブラウザで認証、2回目以降は自動認証されます。
+
+        Args:
+            cache_ttl: 登録者数のディスクキャッシュの有効期間（秒）
+            daily_quota_budget: 1日に使用してよいクオータの上限（ユニット）
+
+        Raises:
+            CacheLockedError: キャッシュファイルを開けなかった場合
         """
-        print("\n" + "="*60)
-        print("🔐 YouTube API 認証処理")
-        print("="*60 + "\n")
+        logger.info("=" * 60)
+        logger.info("🔐 YouTube API 認証処理")
+        logger.info("=" * 60)
 
-        self.youtube = get_authenticated_service()
+        self.creds = get_credentials()
+        self.youtube = get_authenticated_service(self.creds)
         self.channel_cache = {}
+        self.subscriber_ttl = cache_ttl
+        # channel_id -> 登録者数を取得した時刻（ディスクキャッシュの保存時刻と同じ）
+        self._channel_fetched_at: Dict[str, float] = {}
+        # 先読み中の channel_id -> 取得タスク（ページをまたいだ重複取得を防ぐ）
+        self._channel_fetches: Dict[str, asyncio.Task] = {}
+        try:
+            self._disk = shelve.open(CACHE_PATH)
+        except dbm.error as e:
+            raise CacheLockedError(
+                f"キャッシュファイル（{CACHE_PATH}）を開けませんでした: {e}\n"
+                "   別の search_youtube.py が実行中の可能性があります。終了してから再実行してください"
+            ) from e
+
+        # videos.list / channels.list を並行実行するためのイベントループとHTTPクライアント
+        self._loop = asyncio.new_event_loop()
+        self._http: Optional[httpx.AsyncClient] = None
+        self._headers: Dict[str, str] = {}
+        self._headers_token: Optional[str] = None
+
+        # リクエストのペース配分とクオータの使用量
+        self._limiter = AsyncLimiter(MAX_REQUESTS_PER_SECOND, 1)
+        self.quota_budget = daily_quota_budget
+        self.quota_used = {resource: 0 for resource in QUOTA_COSTS}
+        self.quota_exhausted = False  # APIから403が返ったら以降のリクエストを止める
+
+        # 投稿日の下限（月数 -> RFC 3339形式の文字列）
+        self._published_after_cache: Dict[int, str] = {}
+
+        logger.info("=" * 60)
+        logger.info("✅ 認証完了 - API使用準備OK")
+        logger.info("=" * 60)
+
+    def close(self):
+        """HTTPクライアント・イベントループ・ディスクキャッシュを解放"""
+        if self._http is not None:
+            self._loop.run_until_complete(self._http.aclose())
+            self._http = None
+        if not self._loop.is_closed():
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            self._loop.close()
+        self._prune_disk()
+        self._disk.close()
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        共有HTTPクライアントを取得（初回呼び出し時に作成）
+
+        Returns:
+            videos.list / channels.list で共有するHTTPクライアント
+        """
+        if self._http is None:
+            limits = httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS
+            )
+            # HTTP/2で1本の接続に複数リクエストを多重化し、TLSハンドシェイクを最小限にする
+            self._http = httpx.AsyncClient(http2=True, limits=limits, timeout=30.0)
+        return self._http
+
+    def _auth_headers(self) -> Dict[str, str]:
+        """
+        Authorizationヘッダーを返す（トークン期限切れの場合は更新）
+
+        ヘッダーの辞書はトークンが変わったときだけ作り直し、それ以外は使い回します。
+
+        Returns:
+            リクエストヘッダーの辞書
+        """
+        if not self.creds.valid:
+            self.creds.refresh(Request())
+        if self.creds.token != self._headers_token:
+            self._headers = {'Authorization': f'Bearer {self.creds.token}'}
+            self._headers_token = self.creds.token
+        return self._headers
+
+    async def _api_get(self, resource: str, ids: List[str], max_retries: int = 3) -> dict:
+        """
+        YouTube Data APIにGETリクエストを送信（リトライ付き）
+
+        IDは英数字と '-', '_' だけなので、パラメータのエンコードを通さずに
+        API_URL_PREFIXES の末尾へ直接つなげます（カンマもそのまま送る）。
+
+        Args:
+            resource: リソース名（'videos' または 'channels'）
+            ids: 動画IDまたはチャンネルIDのリスト（最大50件）
+            max_retries: 最大リトライ回数
+
+        Returns:
+            APIレスポンス（403でクオータ超過と判断した場合、または超過済みの場合は空の辞書）
+
+        Raises:
+            httpx.HTTPStatusError: リトライ対象外のエラー、またはリトライ回数を超えた場合
+        """
+        # クオータ超過後は問い合わせず、取得済みの結果だけで処理を続ける
+        if self.quota_exhausted:
+            return {}
+
+        client = self._get_http()
+        url = API_URL_PREFIXES[resource] + ','.join(ids)
+
+        for attempt in range(max_retries):
+            async with self._limiter:
+                self._consume_quota(resource)
+                response = await client.get(url, headers=self._auth_headers())
+            if response.status_code in [500, 503] and attempt < max_retries - 1:  # サーバーエラー
+                wait_time = 2 ** attempt  # 指数バックオフ
+                logger.warning(f"⚠️  サーバーエラー発生。{wait_time}秒後にリトライします...")
+                await asyncio.sleep(wait_time)
+                continue
+            if response.status_code == 403:
+                self._mark_quota_exhausted()
+                return {}
+            response.raise_for_status()
+            # 標準のjsonより高速なorjsonでデコード
+            return orjson.loads(response.content)
+
+        return {}
+
+    def _mark_quota_exhausted(self):
+        """APIから403が返ったことを記録（警告は最初の1回だけ表示）"""
+        if not self.quota_exhausted:
+            self.quota_exhausted = True
+            logger.warning("⚠️  API クオータを超過したため、以降のAPI呼び出しを打ち切ります（取得済みの結果で続行）")
+
+    def _quota_key(self) -> str:
+        """
+        当日分のクオータ使用量を保存するキャッシュキーを返す
 
-        print("\n" + "="*60)
-        print("✅ 認証完了 - API使用準備OK")
-        print("="*60 + "\n")
+        タイムゾーンデータベースがない環境（tzdata 未導入のWindowsなど）では
+        太平洋標準時（UTC-8）で代用します。
+
+        Returns:
+            キャッシュキー（太平洋時間の日付ごと）
+        """
+        try:
+            tz = ZoneInfo(QUOTA_TIMEZONE_NAME)
+        except ZoneInfoNotFoundError:
+            tz = timezone(timedelta(hours=-8))
+        return f"quota:{datetime.now(tz).date().isoformat()}"
+
+    def _consume_quota(self, resource: str):
+        """
+        APIコール1回分のクオータ使用量を記録
+
+        Args:
+            resource: リソース名（'search', 'videos', 'channels'）
+        """
+        cost = QUOTA_COSTS[resource]
+        self.quota_used[resource] += cost
+        key = self._quota_key()
+        self._disk[key] = self._disk.get(key, 0) + cost
+
+    def quota_remaining(self) -> int:
+        """
+        本日の残りクオータを返す（実行をまたいで累計）
+
+        Returns:
+            daily_quota_budget から本日の使用量を引いた値
+        """
+        return self.quota_budget - self._disk.get(self._quota_key(), 0)
+
+    def _disk_get(self, key: str, ttl: int):
+        """
+        ディスクキャッシュから値を取得
+
+        Args:
+            key: キャッシュキー
+            ttl: 有効期間（秒）
+
+        Returns:
+            (取得時刻, 値) のタプル（存在しない・期限切れの場合はNone）
+        """
+        cached = self._disk.get(key)
+        if cached is None or time.time() - cached[0] >= ttl:
+            return None
+        return cached
+
+    def _prune_disk(self):
+        """
+        ディスクキャッシュから期限切れのエントリと前日以前のクオータ記録を削除
+
+        登録者数は今回の cache_ttl を基準に判定します。
+        """
+        now = time.time()
+        ttls = {'video': VIDEO_STATS_TTL_SECONDS, 'channel': self.subscriber_ttl}
+        today_quota_key = self._quota_key()
+        stale_keys = []
+        for key in self._disk.keys():
+            kind = key.split(':', 1)[0]
+            if kind == 'quota':
+                if key != today_quota_key:
+                    stale_keys.append(key)
+            elif kind in ttls and now - self._disk[key][0] >= ttls[kind]:
+                stale_keys.append(key)
+
+        for key in stale_keys:
+            del self._disk[key]
+
+    def _disk_set(self, key: str, value) -> float:
+        """
+        ディスクキャッシュに値を保存
+
+        Args:
+            key: キャッシュキー
+            value: 保存する値
+
+        Returns:
+            保存時刻
+        """
+        saved_at = time.time()
+        self._disk[key] = (saved_at, value)
+        return saved_at
 
     def search_videos(
         self,
         keyword: str,
         max_results: int = 50,
-        published_after_months: int = 6
+        published_after_months: int = 6,
+        target_keep: Optional[int] = None,
+        min_views: int = 0,
+        max_subscribers: Optional[int] = None,
+        exclude_shorts: bool = False
     ) -> List[Dict]:
         """
         キーワードで動画を検索
 
+        ページ送りは順番に行いますが、取得済みページの動画統計情報と
+        （max_subscribers 指定時は）条件に合いそうな動画のチャンネル登録者数は
+        次のページの検索と並行して先読みし、キャッシュに載せておきます。
+
+        target_keep を指定すると、ページごとにフィルタ条件に合う件数を数え、
+        目標件数に達した時点でページ送りを打ち切ります（search.list は1回100ユニット）。
+
         Args:
             keyword: 検索キーワード
             max_results: 取得する最大件数
             published_after_months: 何ヶ月前からの動画を取得するか
+            target_keep: フィルタ後に欲しい件数（None の場合は max_results まで取得）
+            min_views: 最小再生回数（登録者数の先読み対象と target_keep の件数見積もりに使用）
+            max_subscribers: 最大登録者数（None の場合は登録者数を先読みしない）
+            exclude_shorts: Shorts を除外するか（同上の絞り込みに使用）
 
         Returns:
-            検索結果のリスト（video_id, title, channel_id, channel_title を含む）
+            検索結果のリスト（video_id, title, channel_id, channel_title,
+            view_count, duration_seconds を含む）
         """
-        print(f"🔍 検索中: キーワード='{keyword}', 最大{max_results}件")
+        logger.info(f"🔍 検索中: キーワード='{keyword}', 最大{max_results}件")
 
-        # 投稿日の下限を計算（N ヶ月前）
-        published_after = datetime.now(timezone.utc) - timedelta(days=30 * published_after_months)
-        published_after_str = published_after.strftime('%Y-%m-%dT%H:%M:%SZ')
+        published_after_str = self._published_after_str(published_after_months)
 
         results = []
+
+        self._loop.run_until_complete(
+            self._search_pages(
+                keyword, max_results, published_after_str, results,
+                target_keep, min_views, max_subscribers, exclude_shorts
+            )
+        )
+
+        logger.info(f"✅ 検索完了: {len(results)}件の動画を取得")
+
+        # 統計情報を検索結果に付与（先読み済みのものはキャッシュから取得）
+        statistics = self.get_video_statistics([v['video_id'] for v in results])
+        for video in results:
+            stats = statistics.get(video['video_id'], {'view_count': 0, 'duration_seconds': 0})
+            video['view_count'] = stats['view_count']
+            video['duration_seconds'] = stats['duration_seconds']
+
+        return results
+
+    def _published_after_str(self, months: int) -> str:
+        """
+        投稿日の下限（N ヶ月前）をRFC 3339形式で返す（インスタンス内でキャッシュ）
+
+        Args:
+            months: 何ヶ月前か
+
+        Returns:
+            'YYYY-MM-DDTHH:MM:SSZ' 形式の文字列
+        """
+        if months not in self._published_after_cache:
+            published_after = datetime.now(timezone.utc) - timedelta(days=30 * months)
+            self._published_after_cache[months] = published_after.strftime('%Y-%m-%dT%H:%M:%SZ')
+        return self._published_after_cache[months]
+
+    async def _search_pages(
+        self,
+        keyword: str,
+        max_results: int,
+        published_after_str: str,
+        results: List[Dict],
+        target_keep: Optional[int] = None,
+        min_views: int = 0,
+        max_subscribers: Optional[int] = None,
+        exclude_shorts: bool = False
+    ):
+        """
+        search.list のページ送りを行い、各ページの動画統計情報を並行して先読み
+
+        Args:
+            keyword: 検索キーワード
+            max_results: 取得する最大件数
+            published_after_str: 投稿日の下限（RFC 3339形式）
+            results: 検索結果を追加するリスト
+            target_keep: フィルタ後に欲しい件数（None の場合は打ち切らない）
+            min_views: 最小再生回数
+            max_subscribers: 最大登録者数
+            exclude_shorts: Shorts を除外するか
+        """
         next_page_token = None
+        prefetch_tasks = []
+        kept_count = 0
+        remaining = max_results
 
         try:
-            while len(results) < max_results:
+            while remaining > 0:
+                # 403を受けた後や、クオータが足りなくなる場合はページ送りを打ち切る
+                if self.quota_exhausted:
+                    break
+                if self.quota_remaining() < QUOTA_COSTS['search']:
+                    logger.warning("⚠️  クオータの上限に達するため、検索を打ち切ります")
+                    break
+
                 # search.list APIを呼び出し
                 request = self.youtube.search().list(
                     part='snippet',
                     q=keyword,
                     type='video',
                     publishedAfter=published_after_str,
-                    maxResults=min(50, max_results - len(results)),  # 最大50件/回
+                    maxResults=min(50, remaining),  # 最大50件/回
                     pageToken=next_page_token,
                     order='relevance'
                 )
 
-                response = self._execute_with_retry(request)
+                # googleapiclientは同期APIのため、別スレッドで実行して先読みと並行させる
+                try:
+                    async with self._limiter:
+                        self._consume_quota('search')
+                        response = await asyncio.to_thread(self._execute_with_retry, request)
+                except HttpError as e:
+                    if e.resp.status == 403:
+                        self._mark_quota_exhausted()
+                        break
+                    raise
 
                 # 結果を整形
-                for item in response.get('items', []):
-                    results.append({
+                page = [
+                    {
                         'video_id': item['id']['videoId'],
                         'title': item['snippet']['title'],
                         'channel_id': item['snippet']['channelId'],
                         'channel_title': item['snippet']['channelTitle']
-                    })
+                    }
+                    for item in response.get('items', [])
+                ]
+                results.extend(page)
+                remaining -= len(page)
+
+                if target_keep is not None:
+                    # 条件に合う件数を数え、目標に達したら次のページは取得しない
+                    # （取得に失敗した場合は件数を見積もれないので、取得済みの結果で打ち切る。
+                    #   統計情報は filter_videos 側で再取得される）
+                    try:
+                        kept_count += await self._count_page_matches(
+                            page, min_views, max_subscribers, exclude_shorts
+                        )
+                    except Exception as e:
+                        logger.warning(f"⚠️  条件に合う件数を確認できなかったため、検索を打ち切ります: {e}")
+                        break
+                    if kept_count >= target_keep:
+                        logger.info(f"🎯 条件に合う動画が目標件数（{target_keep}件）に達したため、検索を打ち切ります")
+                        break
+                else:
+                    # このページの動画統計情報（と登録者数）を次のページの検索と並行して先読み
+                    prefetch_tasks.append(asyncio.create_task(
+                        self._prefetch_page(page, min_views, max_subscribers, exclude_shorts)
+                    ))
 
                 # 次のページがあるかチェック
                 next_page_token = response.get('nextPageToken')
                 if not next_page_token:
                     break
 
-        except HttpError as e:
-            if e.resp.status == 403:
-                print("❌ エラー: API クオータを超過しました")
-                sys.exit(1)
-            else:
-                raise
+        finally:
+            # 先読みの失敗は致命的ではない（filter_videos で再取得される）
+            for task in asyncio.as_completed(prefetch_tasks):
+                try:
+                    await task
+                except Exception as e:
+                    logger.warning(f"⚠️  動画統計情報の先読みに失敗しました: {e}")
 
-        print(f"✅ 検索完了: {len(results)}件の動画を取得")
-        return results
+    async def _prefetch_page(
+        self,
+        page: List[Dict],
+        min_views: int,
+        max_subscribers: Optional[int],
+        exclude_shorts: bool
+    ) -> List[Dict]:
+        """
+        1ページ分の動画統計情報を取得し、条件に合いそうな動画のチャンネル登録者数も先読み
+
+        取得した統計情報・登録者数はキャッシュに残るため、後の filter_videos で再利用されます。
+
+        Args:
+            page: 1ページ分の検索結果
+            min_views: 最小再生回数
+            max_subscribers: 最大登録者数（None の場合は登録者数を先読みしない）
+            exclude_shorts: Shorts を除外するか
+
+        Returns:
+            再生回数とShortsの条件を満たした動画のリスト
+        """
+        statistics, uncached_ids = self._split_cached_video_statistics(v['video_id'] for v in page)
+        if uncached_ids:
+            statistics.update(await self._fetch_video_statistics(uncached_ids))
+
+        # 再生回数とShortsの条件で先に絞り込み、残った動画のチャンネルだけを問い合わせる
+        candidates = [
+            v for v in page
+            if (stats := statistics.get(v['video_id'])) is not None
+            and stats['view_count'] >= min_views
+            and not (exclude_shorts and stats['duration_seconds'] <= 60)
+        ]
+        if max_subscribers is None:
+            return candidates
+
+        channel_ids = list(dict.fromkeys(v['channel_id'] for v in candidates))
+        # 期限切れが近いチャンネルも先読みの時点で更新しておく
+        uncached_channel_ids, expiring_ids = self._load_cached_channels(channel_ids)
+        if uncached_channel_ids or expiring_ids:
+            await self._fetch_channels_once(uncached_channel_ids + expiring_ids)
+
+        return candidates
+
+    async def _fetch_channels_once(self, channel_ids: List[str]):
+        """
+        チャンネル登録者数を取得（他のページで取得中のチャンネルはその完了を待つ）
+
+        ページごとの先読みは並行して動くため、同じチャンネルが複数のページに
+        出てきても channels.list への問い合わせは1回にまとめます。
+
+        Args:
+            channel_ids: キャッシュにない、または期限切れが近い channel_id のリスト
+        """
+        new_ids = [cid for cid in channel_ids if cid not in self._channel_fetches]
+        if new_ids:
+            task = asyncio.ensure_future(self._fetch_channel_subscribers(new_ids))
+            for cid in new_ids:
+                self._channel_fetches[cid] = task
+
+            def done(_):
+                for cid in new_ids:
+                    self._channel_fetches.pop(cid, None)
+            task.add_done_callback(done)
+
+        pending = {self._channel_fetches[cid] for cid in channel_ids if cid in self._channel_fetches}
+        if pending:
+            await asyncio.gather(*pending)
+
+    async def _count_page_matches(
+        self,
+        page: List[Dict],
+        min_views: int,
+        max_subscribers: Optional[int],
+        exclude_shorts: bool
+    ) -> int:
+        """
+        1ページ分の検索結果のうち、フィルタ条件に合う動画の件数を数える
+
+        Args:
+            page: 1ページ分の検索結果
+            min_views: 最小再生回数
+            max_subscribers: 最大登録者数（None の場合は上限なし）
+            exclude_shorts: Shorts を除外するか
+
+        Returns:
+            条件に合う動画の件数
+        """
+        candidates = await self._prefetch_page(page, min_views, max_subscribers, exclude_shorts)
+        if max_subscribers is None:
+            return len(candidates)
+
+        return sum(
+            1 for v in candidates
+            if (subscriber_count := self.channel_cache.get(v['channel_id'])) is not None
+            and subscriber_count <= max_subscribers
+        )
 
     def get_video_statistics(self, video_ids: List[str]) -> Dict[str, dict]:
         """
@@ -237,21 +745,56 @@ class YouTubeSearcher:
         Returns:
             video_id -> {'view_count': int, 'duration_seconds': int} の辞書
         """
-        print(f"📊 動画統計情報を取得中: {len(video_ids)}件")
+        logger.debug(f"📊 動画統計情報を取得中: {len(video_ids)}件")
+
+        # ディスクキャッシュにない video_id だけを取得
+        statistics, uncached_ids = self._split_cached_video_statistics(video_ids)
+
+        if uncached_ids:
+            statistics.update(self._loop.run_until_complete(self._fetch_video_statistics(uncached_ids)))
+
+        logger.debug(f"✅ 動画統計情報の取得完了")
+        return statistics
 
+    def _split_cached_video_statistics(self, video_ids: Iterable[str]):
+        """
+        動画統計情報をディスクキャッシュにあるものとないものに分ける
+
+        Args:
+            video_ids: 動画IDのイテラブル
+
+        Returns:
+            (キャッシュ済みの video_id -> 統計情報 の辞書, キャッシュにない video_id のリスト)
+        """
         statistics = {}
+        uncached_ids = []
+        for video_id in video_ids:
+            cached = self._disk_get(f'video:{video_id}', VIDEO_STATS_TTL_SECONDS)
+            if cached is None:
+                uncached_ids.append(video_id)
+            else:
+                statistics[video_id] = cached[1]
+        return statistics, uncached_ids
 
-        # 50件ずつバッチ処理
-        for i in range(0, len(video_ids), 50):
-            batch = video_ids[i:i+50]
+    async def _fetch_video_statistics(self, video_ids: List[str]) -> Dict[str, dict]:
+        """
+        videos.list を50件ずつのバッチに分けて並行実行し、結果をディスクキャッシュに格納
 
-            request = self.youtube.videos().list(
-                part='statistics,contentDetails',
-                id=','.join(batch)
-            )
+        Args:
+            video_ids: 動画IDのリスト
+
+        Returns:
+            video_id -> {'view_count': int, 'duration_seconds': int} の辞書
+        """
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        batches = [video_ids[i:i + BATCH_SIZE] for i in range(0, len(video_ids), BATCH_SIZE)]
 
-            response = self._execute_with_retry(request)
+        async def fetch(batch: List[str]) -> dict:
+            async with sem:
+                return await self._api_get('videos', batch)
 
+        statistics = {}
+        for response in await asyncio.gather(*[fetch(batch) for batch in batches]):
             for item in response.get('items', []):
                 video_id = item['id']
                 view_count = int(item['statistics'].get('viewCount', 0))
@@ -264,8 +807,8 @@ class YouTubeSearcher:
                     'view_count': view_count,
                     'duration_seconds': duration_seconds
                 }
+                self._disk_set(f'video:{video_id}', statistics[video_id])
 
-        print(f"✅ 動画統計情報の取得完了")
         return statistics
 
     def get_channel_subscribers(self, channel_ids: List[str]) -> Dict[str, Optional[int]]:
@@ -278,36 +821,78 @@ class YouTubeSearcher:
         Returns:
             channel_id -> 登録者数 の辞書（取得できない場合はNone）
         """
-        # キャッシュにない channel_id だけを取得
-        uncached_ids = [cid for cid in channel_ids if cid not in self.channel_cache]
+        # キャッシュにない channel_id と、期限切れが近い channel_id だけを取得
+        uncached_ids, expiring_ids = self._load_cached_channels(channel_ids)
 
-        if uncached_ids:
-            print(f"👥 チャンネル登録者数を取得中: {len(uncached_ids)}件（キャッシュ: {len(channel_ids) - len(uncached_ids)}件）")
+        if uncached_ids or expiring_ids:
+            logger.debug(
+                f"👥 チャンネル登録者数を取得中: {len(uncached_ids)}件"
+                f"（キャッシュ: {len(channel_ids) - len(uncached_ids)}件、うち更新: {len(expiring_ids)}件）"
+            )
 
-            # 50件ずつバッチ処理
-            for i in range(0, len(uncached_ids), 50):
-                batch = uncached_ids[i:i+50]
+            # 期限切れが近いチャンネルも同じバッチで更新しておく
+            self._loop.run_until_complete(self._fetch_channel_subscribers(uncached_ids + expiring_ids))
 
-                request = self.youtube.channels().list(
-                    part='statistics',
-                    id=','.join(batch)
-                )
+            logger.debug(f"✅ チャンネル登録者数の取得完了")
 
-                response = self._execute_with_retry(request)
+        # キャッシュから返す
+        return {cid: self.channel_cache.get(cid) for cid in channel_ids}
 
-                for item in response.get('items', []):
-                    channel_id = item['id']
-                    # hiddenSubscriberCount の場合は登録者数が取得できない
-                    if item['statistics'].get('hiddenSubscriberCount', False):
-                        self.channel_cache[channel_id] = None
-                    else:
-                        subscriber_count = int(item['statistics'].get('subscriberCount', 0))
-                        self.channel_cache[channel_id] = subscriber_count
+    def _load_cached_channels(self, channel_ids: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        有効期限内のディスクキャッシュをメモリキャッシュに読み込む
 
-            print(f"✅ チャンネル登録者数の取得完了")
+        期限切れが近いかどうかは、メモリキャッシュに読み込み済みかに関わらず
+        取得時刻（ディスクキャッシュの保存時刻）から判定します。
 
-        # キャッシュから返す
-        return {cid: self.channel_cache.get(cid) for cid in channel_ids}
+        Args:
+            channel_ids: チャンネルIDのリスト
+
+        Returns:
+            (キャッシュにない channel_id のリスト, 有効期間の残りが10%を切った channel_id のリスト)
+        """
+        now = time.time()
+        refresh_after = self.subscriber_ttl * 0.9
+        for cid in channel_ids:
+            if cid not in self.channel_cache:
+                cached = self._disk_get(f'channel:{cid}', self.subscriber_ttl)
+                if cached is not None:
+                    self.channel_cache[cid] = cached[1]
+                    self._channel_fetched_at[cid] = cached[0]
+
+        uncached_ids = [cid for cid in channel_ids if cid not in self.channel_cache]
+        expiring_ids = [
+            cid for cid in channel_ids
+            if cid in self._channel_fetched_at and now - self._channel_fetched_at[cid] >= refresh_after
+        ]
+        return uncached_ids, expiring_ids
+
+    async def _fetch_channel_subscribers(self, channel_ids: List[str]):
+        """
+        channels.list を50件ずつのバッチに分けて並行実行し、結果をキャッシュに格納
+
+        Args:
+            channel_ids: チャンネルIDのリスト
+        """
+        sem = asyncio.Semaphore(MAX_CONCURRENCY)
+        batches = [channel_ids[i:i + BATCH_SIZE] for i in range(0, len(channel_ids), BATCH_SIZE)]
+
+        async def fetch(batch: List[str]) -> dict:
+            async with sem:
+                return await self._api_get('channels', batch)
+
+        for response in await asyncio.gather(*[fetch(batch) for batch in batches]):
+            for item in response.get('items', []):
+                channel_id = item['id']
+                # hiddenSubscriberCount の場合は登録者数が取得できない
+                if item['statistics'].get('hiddenSubscriberCount', False):
+                    self.channel_cache[channel_id] = None
+                else:
+                    subscriber_count = int(item['statistics'].get('subscriberCount', 0))
+                    self.channel_cache[channel_id] = subscriber_count
+                self._channel_fetched_at[channel_id] = self._disk_set(
+                    f'channel:{channel_id}', self.channel_cache[channel_id]
+                )
 
     def filter_videos(
         self,
@@ -320,7 +905,7 @@ class YouTubeSearcher:
         動画をフィルタリング
 
         Args:
-            videos: 動画情報のリスト
+            videos: search_videos の結果（view_count, duration_seconds を含む）
             min_views: 最小再生回数
             max_subscribers: 最大登録者数
             exclude_shorts: Shorts（60秒以下の動画）を除外するか
@@ -328,94 +913,113 @@ class YouTubeSearcher:
         Returns:
             条件に合致する動画のリスト
         """
-        print(f"🔍 フィルタリング中: 再生回数>={min_views}, 登録者数<={max_subscribers}")
-        if exclude_shorts:
-            print("   ⏱️  Shorts（60秒以下）を除外")
-
-        # 動画IDとチャンネルIDを抽出
-        video_ids = [v['video_id'] for v in videos]
-        channel_ids = list(set([v['channel_id'] for v in videos]))
-
-        # 統計情報を取得
-        video_stats = self.get_video_statistics(video_ids)
-        channel_subscribers = self.get_channel_subscribers(channel_ids)
-
-        # フィルタリング
-        filtered = []
-        shorts_count = 0
-        for video in videos:
-            video_id = video['video_id']
-            channel_id = video['channel_id']
+        filtered = list(self.iter_filtered_videos(videos, min_views, max_subscribers, exclude_shorts))
+        logger.info(f"✅ フィルタリング完了: {len(filtered)}件が条件に合致")
+        return filtered
 
-            stats = video_stats.get(video_id, {'view_count': 0, 'duration_seconds': 0})
-            view_count = stats['view_count']
-            duration_seconds = stats['duration_seconds']
-            subscriber_count = channel_subscribers.get(channel_id)
+    def iter_filtered_videos(
+        self,
+        videos: List[Dict],
+        min_views: int,
+        max_subscribers: int,
+        exclude_shorts: bool = False
+    ) -> Iterator[Dict]:
+        """
+        条件に合致する動画を1件ずつ返すジェネレータ
 
-            # 登録者数が取得できない場合は除外
-            if subscriber_count is None:
-                continue
+        export_to_csv に直接渡すと、結果リストを作らずにCSVへ書き出せます。
 
-            # Shorts除外チェック
-            if exclude_shorts and duration_seconds <= 60:
-                shorts_count += 1
-                continue
+        Args:
+            videos: search_videos の結果（view_count, duration_seconds を含む）
+            min_views: 最小再生回数
+            max_subscribers: 最大登録者数
+            exclude_shorts: Shorts（60秒以下の動画）を除外するか
 
-            # 条件チェック
-            if view_count >= min_views and subscriber_count <= max_subscribers:
-                video['view_count'] = view_count
-                video['duration_seconds'] = duration_seconds
-                video['subscriber_count'] = subscriber_count
-                filtered.append(video)
+        Yields:
+            条件に合致する動画（subscriber_count を付与）
+        """
+        logger.info(f"🔍 フィルタリング中: 再生回数>={min_views}, 登録者数<={max_subscribers}")
+        if exclude_shorts:
+            logger.info("   ⏱️  Shorts（60秒以下）を除外")
 
-        print(f"✅ フィルタリング完了: {len(filtered)}件が条件に合致")
+        # 1段階目: 再生回数とShortsの条件で絞り込む（統計情報は search_videos で付与済み）
         if exclude_shorts:
-            print(f"   （Shorts除外: {shorts_count}件）")
-        return filtered
+            shorts_count = sum(1 for v in videos if v['duration_seconds'] <= 60)
+            logger.info(f"   （Shorts除外: {shorts_count}件）")
+        candidates = [
+            v for v in videos
+            if v['view_count'] >= min_views
+            and not (exclude_shorts and v['duration_seconds'] <= 60)
+        ]
+
+        # 2段階目: 残った動画のチャンネルだけ登録者数を取得
+        # （キャッシュにないチャンネルだけを問い合わせる）
+        channel_ids = list(dict.fromkeys(v['channel_id'] for v in candidates))
+        channel_subscribers = self.get_channel_subscribers(channel_ids)
 
-    def export_to_csv(self, videos: List[Dict], keyword: str) -> str:
+        # フィルタリング（walrusで辞書の参照を1回にまとめる）
+        yield from (
+            {**video, 'subscriber_count': subscriber_count}
+            for video in candidates
+            if (subscriber_count := channel_subscribers.get(video['channel_id'])) is not None
+            and subscriber_count <= max_subscribers
+        )
+
+    def export_to_csv(self, videos: Iterable[Dict], keyword: str) -> Tuple[Optional[str], int]:
         """
-        動画リストをCSVファイルに出力
+        動画をCSVファイルに出力
+
+        ジェネレータを渡した場合は、届いた順にそのまま書き出します。
+        書き込みは一時ファイルに行い、最後まで書けた場合だけ本来のファイル名に置き換えるため、
+        途中でエラー（APIエラーや Ctrl-C など）が起きても書きかけのCSVは残りません。
 
         Args:
-            videos: 動画情報のリスト
+            videos: 動画情報のイテラブル（iter_filtered_videos の結果など）
             keyword: 検索キーワード（ファイル名に使用）
 
         Returns:
-            出力したファイル名
+            (出力したファイル名, 出力件数)。0件の場合はファイルを残さず None を返す
         """
         # ファイル名を生成（タイムスタンプ付き）
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         # ファイル名に使えない文字を置換
-        safe_keyword = "".join(c if c.isalnum() or c in (' ', '_', '-') else '_' for c in keyword)
+        safe_keyword = keyword.translate(_SAFE_TABLE)
         filename = f"youtube_results_{safe_keyword}_{timestamp}.csv"
         output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'output')
         os.makedirs(output_dir, exist_ok=True)
         file_path = os.path.join(output_dir, filename)
 
-        print(f"💾 CSV出力中: {os.path.join('output', filename)}")
+        logger.info(f"💾 CSV出力中: {os.path.join('output', filename)}")
 
         # UTF-8 BOM付きで出力（Excel対応）
-        with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
-            writer = csv.writer(f)
-
-            # ヘッダー
-            writer.writerow(['動画タイトル', 'url', 'チャンネル名', '再生回数', '動画の長さ（秒）', '登録者数'])
-
-            # データ
-            for video in videos:
-                url = f"https://www.youtube.com/watch?v={video['video_id']}"
-                writer.writerow([
-                    video['title'],
-                    url,
-                    video['channel_title'],
-                    video['view_count'],
-                    video['duration_seconds'],
-                    video['subscriber_count']
-                ])
-
-        print(f"✅ CSV出力完了: {os.path.join('output', filename)}")
-        return os.path.join('output', filename)
+        # 1MBのバッファにまとめて書き込み、行ごとのwriteシステムコールを避ける
+        tmp_path = file_path + '.tmp'
+        count = 0
+        try:
+            with open(tmp_path, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as f:
+                writer = csv.DictWriter(f, fieldnames=list(CSV_COLUMNS), extrasaction='ignore')
+
+                # ヘッダー
+                writer.writerow(CSV_COLUMNS)
+
+                # データ（呼び出し元の辞書は書き換えない）
+                for video in videos:
+                    writer.writerow({**video, 'url': f"https://www.youtube.com/watch?v={video['video_id']}"})
+                    count += 1
+        except BaseException:
+            # open() 自体が失敗した場合は一時ファイルがないので、元の例外をそのまま伝える
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+
+        if count == 0:
+            os.remove(tmp_path)
+            return None, 0
+
+        os.replace(tmp_path, file_path)
+
+        logger.info(f"✅ CSV出力完了: {os.path.join('output', filename)}")
+        return os.path.join('output', filename), count
 
     def _execute_with_retry(self, request, max_retries: int = 3):
         """
@@ -435,7 +1039,7 @@ class YouTubeSearcher:
                 if e.resp.status in [500, 503]:  # サーバーエラー
                     if attempt < max_retries - 1:
                         wait_time = 2 ** attempt  # 指数バックオフ
-                        print(f"⚠️  サーバーエラー発生。{wait_time}秒後にリトライします...")
+                        logger.warning(f"⚠️  サーバーエラー発生。{wait_time}秒後にリトライします...")
                         time.sleep(wait_time)
                     else:
                         raise
@@ -495,9 +1099,48 @@ def main():
         action='store_true',
         help='YouTube Shorts（60秒以下の動画）を除外する'
     )
+    parser.add_argument(
+        '--target-keep',
+        type=int,
+        default=None,
+        help='条件に合う動画がこの件数に達したら検索を打ち切る（クオータ節約）'
+    )
+    parser.add_argument(
+        '--daily-quota-budget',
+        type=int,
+        default=DAILY_QUOTA_BUDGET,
+        help=f'1日に使用するクオータの上限（デフォルト: {DAILY_QUOTA_BUDGET}）。超える前に検索を打ち切ります'
+    )
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='進捗メッセージを表示しない（警告と結果のみ表示）'
+    )
+    parser.add_argument(
+        '--verbose',
+        action='store_true',
+        help='APIバッチごとの詳細な進捗も表示する'
+    )
+    parser.add_argument(
+        '--cache-ttl',
+        type=int,
+        default=SUBSCRIBER_TTL_SECONDS,
+        help=f'登録者数キャッシュの有効期間（秒、デフォルト: {SUBSCRIBER_TTL_SECONDS}）'
+    )
 
     args = parser.parse_args()
 
+    # ロギング設定（進捗はINFO、APIバッチごとの詳細はDEBUG）
+    if args.quiet:
+        log_level = logging.WARNING
+    elif args.verbose:
+        log_level = logging.DEBUG
+    else:
+        log_level = logging.INFO
+    # 依存ライブラリのログはWARNING以上のみ表示する
+    logging.basicConfig(format='%(message)s', stream=sys.stdout)
+    logger.setLevel(log_level)
+
     print("=" * 60)
     print("YouTube動画検索・フィルタリングスクリプト（OAuth2認証版）")
     print("=" * 60)
@@ -511,43 +1154,55 @@ def main():
     print("=" * 60)
     print()
 
+    searcher = None
+
     try:
         # YouTubeSearcherインスタンスを作成（OAuth2認証）
-        searcher = YouTubeSearcher()
+        searcher = YouTubeSearcher(
+            cache_ttl=args.cache_ttl,
+            daily_quota_budget=args.daily_quota_budget
+        )
 
         # 動画を検索
         videos = searcher.search_videos(
             keyword=args.keyword,
             max_results=args.max_results,
-            published_after_months=6
+            published_after_months=6,
+            target_keep=args.target_keep,
+            min_views=args.min_views,
+            max_subscribers=args.max_subscribers,
+            exclude_shorts=args.exclude_shorts
         )
 
         if not videos:
             print("⚠️  検索結果が0件です")
             return
 
-        # フィルタリング
-        filtered_videos = searcher.filter_videos(
+        # フィルタリングしながらCSVへ書き出す
+        filtered_videos = searcher.iter_filtered_videos(
             videos=videos,
             min_views=args.min_views,
             max_subscribers=args.max_subscribers,
             exclude_shorts=args.exclude_shorts
         )
+        filename, count = searcher.export_to_csv(filtered_videos, args.keyword)
 
-        if not filtered_videos:
+        if count == 0:
             print("⚠️  条件に合致する動画が見つかりませんでした")
             return
 
-        # CSV出力
-        filename = searcher.export_to_csv(filtered_videos, args.keyword)
-
         print()
         print("=" * 60)
         print(f"🎉 完了!")
-        print(f"   抽出件数: {len(filtered_videos)}件")
+        print(f"   抽出件数: {count}件")
         print(f"   出力ファイル: {filename}")
+        print(f"   クオータ使用量: {sum(searcher.quota_used.values())}ユニット"
+              f"（本日の残り: {searcher.quota_remaining()}）")
         print("=" * 60)
 
+    except CacheLockedError as e:
+        logger.error(f"❌ エラー: {e}")
+        sys.exit(1)
     except HttpError as e:
         print(f"❌ YouTube API エラー: {e}")
         sys.exit(1)
@@ -556,6 +1211,9 @@ def main():
         import traceback
         traceback.print_exc()
         sys.exit(1)
+    finally:
+        if searcher is not None:
+            searcher.close()
 
 
 if __name__ == '__main__':